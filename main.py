@@ -1,6 +1,8 @@
 from utils.extract import ScraperConfig, ProductScraper
 from utils.transform import TransformConfig, DataTransformer
-from utils.load import LoadConfig, DataLoader
+from utils.load import LoadConfig, DataLoader, write_csv
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import time
 import sys
 import logging
@@ -13,10 +15,11 @@ def setup_logging() -> logging.Logger:
     )
     return logging.getLogger(__name__)
 
+logger = setup_logging()
+
 def run_etl_pipeline():
     """Execute the complete ETL pipeline."""
     start_time = time.time()
-    logger = setup_logging()
     
     try:
         # Extract
@@ -24,12 +27,12 @@ def run_etl_pipeline():
         scraper_config = ScraperConfig()
         scraper = ProductScraper(scraper_config, logger)
         
-        df_raw = scraper.scrape()
+        df_raw = asyncio.run(scraper.scrape_async())
         if df_raw.empty:
             print(" Extraction failed: No data retrieved")
             return False
             
-        df_raw.to_csv('products_raw.csv', index=False)
+        write_csv(df_raw, 'products_raw.csv')
         print(f" Extraction completed: {len(df_raw)} records extracted")
 
         # Transform
@@ -49,10 +52,23 @@ def run_etl_pipeline():
         load_config = LoadConfig()
         loader = DataLoader(load_config)
         
-        # Execute loading operations
-        csv_success = loader.load_to_csv(df_transformed)
-        sheets_success = loader.load_to_google_sheets(df_transformed)
-        postgres_success = loader.load_to_postgres(df_transformed)
+        # Validate once and let the loaders skip their own check
+        if not loader.validate_dataframe(df_transformed):
+            print(" Loading failed: Data validation failed")
+            return False
+
+        # Execute loading operations concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'csv': executor.submit(loader.load_to_csv, df_transformed, validated=True),
+                'sheets': executor.submit(loader.load_to_google_sheets, df_transformed),
+                'postgres': executor.submit(loader.load_to_postgres, df_transformed, validated=True)
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        csv_success = results['csv']
+        sheets_success = results['sheets']
+        postgres_success = results['postgres']
         
         # Final summary
         print("\n=== ETL Pipeline Summary ===")
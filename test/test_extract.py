@@ -1 +1,82 @@
-
+import logging
+
+import pytest
+from lxml import html
+
+from utils.extract import COLUMNS, ScraperConfig, ProductScraper
+
+PAGE = """<html><head></head><body>
+<div id="collectionList">
+  <div class="collection-card">
+    <div class="product-details">
+      <h3 class="product-title">T-shirt 2</h3>
+      <div class="price-container"><span class="price">$102.15</span></div>
+      <p style="font-size: 14px; color: #777;">Rating: ⭐ 3.9 / 5</p>
+      <p style="font-size: 14px; color: #777;">3 Colors</p>
+      <p style="font-size: 14px; color: #777;">Size: M</p>
+      <p style="font-size: 14px; color: #777;">Gender: Women</p>
+    </div>
+  </div>
+  <div class="collection-card">
+    <div class="product-details">
+      <h3 class="product-title">Unknown Product</h3>
+      <p class="price">Price Unavailable</p>
+      <p style="font-size: 14px; color: #777;">Rating: ⭐ Invalid Rating / 5</p>
+      <p style="font-size: 14px; color: #777;">5 Colors</p>
+      <p style="font-size: 14px; color: #777;">Size: XL</p>
+      <p style="font-size: 14px; color: #777;">Gender: Men</p>
+      <p>Ignored: unstyled paragraph</p>
+    </div>
+  </div>
+  <div class="collection-card"><img src="placeholder.png"></div>
+</div>
+</body></html>""".encode('utf-8')
+
+
+@pytest.fixture
+def scraper() -> ProductScraper:
+    return ProductScraper(ScraperConfig(), logging.getLogger('test'))
+
+
+def test_process_page_content_extracts_rows(scraper):
+    rows = scraper._process_page_content(PAGE, 1)
+
+    assert len(rows) == 2
+    assert all(len(row) == len(COLUMNS) for row in rows)
+
+    first = dict(zip(COLUMNS, rows[0]))
+    assert first['Title'] == 'T-shirt 2'
+    assert first['Price'] == '$102.15'
+    assert first['Rating'] == '3.9'
+    assert first['Colors'] == '3 Colors'
+    assert first['Size'] == 'Size: M'
+    assert first['Gender'] == 'Gender: Women'
+
+
+def test_process_page_content_shares_page_timestamp(scraper):
+    rows = scraper._process_page_content(PAGE, 1)
+
+    assert rows[0][-1] == rows[1][-1]
+
+
+def test_process_page_content_without_meta_charset_decodes_utf8(scraper):
+    rows = scraper._process_page_content(PAGE, 1)
+
+    assert '⭐' not in rows[0][COLUMNS.index('Rating')]
+    assert rows[1][COLUMNS.index('Rating')] == 'Invalid Rating'
+
+
+def test_process_page_content_missing_grid(scraper):
+    assert scraper._process_page_content(b'<html><body><p>empty</p></body></html>', 3) == []
+
+
+def test_get_product_info_ignores_price_outside_span(scraper):
+    card = html.fromstring(PAGE, parser=html.HTMLParser(encoding='utf-8'))
+    details = card.xpath("//div[@class='product-details']")[1]
+
+    info = scraper._get_product_info(details)
+
+    assert info['Title'] == 'Unknown Product'
+    assert info['Price'] is None
+    assert info['Size'] == 'Size: XL'
+    assert info['Gender'] == 'Gender: Men'
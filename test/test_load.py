@@ -1 +1,117 @@
-
+import pandas as pd
+import pytest
+from psycopg2.extensions import adapt
+
+import utils.load
+from utils.load import LoadConfig, DataLoader
+
+
+@pytest.fixture
+def cleaned_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Title': pd.Series(['T-shirt 2', 'Hoodie 3'], dtype='string[pyarrow]'),
+        'Price': pd.Series([1634400.0, 80000.0], dtype='float32'),
+        'Rating': [3.9, 4.8],
+        'Colors': pd.Series([3, 5], dtype='int16'),
+        'Size': pd.Series(['M', 'XL'], dtype='category'),
+        'Gender': pd.Series(['Women', 'Men'], dtype='category'),
+        'timestamp': pd.Series(['2024-12-01 10:15:30', pd.NA], dtype='string[pyarrow]'),
+    })
+
+
+@pytest.fixture
+def loader() -> DataLoader:
+    return DataLoader(LoadConfig())
+
+
+def test_validate_dataframe_accepts_cleaned_data(loader, cleaned_df):
+    assert loader.validate_dataframe(cleaned_df)
+
+
+def test_validate_dataframe_rechecks_after_mutation(loader, cleaned_df):
+    assert loader.validate_dataframe(cleaned_df)
+
+    cleaned_df.loc[0, 'Price'] = -5
+
+    assert not loader.validate_dataframe(cleaned_df)
+
+
+@pytest.mark.parametrize('column, value', [
+    ('Title', ''),
+    ('Rating', 5.5),
+    ('Colors', 0),
+    ('Size', 'XXXL'),
+    ('Gender', 'Kids'),
+])
+def test_validate_dataframe_rejects_invalid_values(loader, cleaned_df, column, value):
+    df = cleaned_df.astype(object)
+    df.loc[1, column] = value
+
+    assert not loader.validate_dataframe(df)
+
+
+def test_load_to_csv_skips_validation_when_already_validated(loader, cleaned_df, tmp_path, monkeypatch):
+    def fail(df):
+        raise AssertionError("validate_dataframe should not be called")
+
+    monkeypatch.setattr(loader, 'validate_dataframe', fail)
+    output = tmp_path / 'products.csv'
+
+    assert loader.load_to_csv(cleaned_df, str(output), validated=True)
+    assert pd.read_csv(output)['Title'].tolist() == ['T-shirt 2', 'Hoodie 3']
+
+
+class FakeConnection:
+    def __init__(self):
+        self.committed = False
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connection = FakeConnection()
+
+    def raw_connection(self):
+        return self.connection
+
+
+def test_insert_rows_sends_adaptable_python_values(cleaned_df, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        utils.load, 'execute_values',
+        lambda cur, sql, rows, page_size: calls.append((sql, rows, page_size))
+    )
+    engine = FakeEngine()
+    loader = DataLoader(LoadConfig(TABLE_NAME='products'))
+
+    loader._insert_rows(engine, cleaned_df)
+
+    (sql, rows, page_size), = calls
+    assert sql == (
+        'INSERT INTO products ("Title", "Price", "Rating", "Colors", "Size", "Gender", "timestamp") '
+        'VALUES %s'
+    )
+    assert page_size == 1000
+    assert rows == [
+        ('T-shirt 2', 1634400.0, 3.9, 3, 'M', 'Women', '2024-12-01 10:15:30'),
+        ('Hoodie 3', 80000.0, 4.8, 5, 'XL', 'Men', None),
+    ]
+    for row in rows:
+        for value in row:
+            adapt(value).getquoted()
+    assert engine.connection.committed and engine.connection.closed
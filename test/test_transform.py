@@ -1 +1,100 @@
-
+import pandas as pd
+import pytest
+
+from utils.transform import TransformConfig, DataTransformer
+
+COLUMNS = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'timestamp']
+
+
+def legacy_row(row: dict, config: TransformConfig) -> dict:
+    """Reference implementation of the original per-row transformation rules."""
+    def price(value):
+        try:
+            return float(value.replace('$', '').replace(',', '').strip()) * config.EXCHANGE_RATE
+        except (ValueError, AttributeError):
+            return None
+
+    def rating(value):
+        if value is None or 'Invalid' in value or 'Not Rated' in value:
+            return None
+        try:
+            return float(value.split('/')[0].strip())
+        except ValueError:
+            return None
+
+    def colors(value):
+        first = value.split()[0] if value else ''
+        return int(first) if first.isdigit() else None
+
+    def prefixed(value, prefix, valid):
+        cleaned = value.replace(prefix, '').strip() if value else None
+        return cleaned if cleaned in valid else None
+
+    return {
+        'Title': row['Title'],
+        'Price': price(row['Price']),
+        'Rating': rating(row['Rating']),
+        'Colors': colors(row['Colors']),
+        'Size': prefixed(row['Size'], 'Size:', config.VALID_SIZES),
+        'Gender': prefixed(row['Gender'], 'Gender:', config.VALID_GENDERS),
+        'timestamp': pd.to_datetime(row['timestamp']).strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+@pytest.fixture
+def raw_df() -> pd.DataFrame:
+    rows = [
+        ('T-shirt 1', '$102.15', '3.9', '3 Colors', 'Size: M', 'Gender: Women'),
+        ('Hoodie 2', '$1,250.00', '4.8 / 5', '5 Colors', 'Size: XXL', 'Gender: Men'),
+        ('Jacket 3', 'Price Unavailable', '4.0', '2 Colors', 'Size: L', 'Gender: Unisex'),
+        ('Pants 4', '$45.00', 'Invalid Rating', '1 Colors', 'Size: S', 'Gender: Men'),
+        ('Shirt 5', '$60.00', 'Not Rated', '4 Colors', 'Size: XS', 'Gender: Women'),
+        ('Dress 6', '$80.00', '4.2', 'Many Colors', 'Size: M', 'Gender: Women'),
+        ('Skirt 7', '$33.50', '3.1', '2 Colors', 'Size: XXXL', 'Gender: Women'),
+        ('Cap 8', '$12.00', '2.5', '1 Colors', 'Size: M', 'Gender: Kids'),
+        ('Unknown Product', '$100.00', '4.5', '3 Colors', 'Size: M', 'Gender: Men'),
+        ('Scarf 9', None, '3.3', '6 Colors', 'Size: L', 'Gender: Unisex'),
+        ('T-shirt 1', '$102.15', '3.9', '3 Colors', 'Size: M', 'Gender: Women'),
+    ]
+    return pd.DataFrame(
+        [row + ('2024-12-01T10:15:30.123456',) for row in rows],
+        columns=COLUMNS
+    )
+
+
+def test_transform_dataframe_matches_legacy_rules(raw_df):
+    config = TransformConfig()
+    result = DataTransformer(config).transform_dataframe(raw_df)
+
+    expected = pd.DataFrame([legacy_row(row, config) for row in raw_df.to_dict('records')])
+    expected = expected.dropna(subset=COLUMNS[:-1])
+    expected = expected[expected['Title'] != 'Unknown Product'].drop_duplicates()
+
+    assert result.astype(object).values.tolist() == expected.astype(object).values.tolist()
+    assert result['Title'].tolist() == ['T-shirt 1', 'Hoodie 2']
+
+
+def test_transform_dataframe_converts_values(raw_df):
+    result = DataTransformer(TransformConfig()).transform_dataframe(raw_df)
+    first = result.iloc[0]
+
+    assert first['Price'] == pytest.approx(102.15 * 16000.0)
+    assert first['Rating'] == 3.9
+    assert first['Colors'] == 3
+    assert first['Size'] == 'M'
+    assert first['Gender'] == 'Women'
+    assert first['timestamp'] == '2024-12-01 10:15:30'
+
+
+def test_transform_dataframe_does_not_mutate_input(raw_df):
+    original = raw_df.copy()
+    DataTransformer(TransformConfig()).transform_dataframe(raw_df)
+
+    pd.testing.assert_frame_equal(raw_df, original)
+
+
+def test_transform_dataframe_missing_columns_returns_empty():
+    result = DataTransformer(TransformConfig()).transform_dataframe(pd.DataFrame({'Title': ['A']}))
+
+    assert result.empty
+    assert result.columns.tolist() == COLUMNS
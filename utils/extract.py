@@ -1,12 +1,15 @@
+import asyncio
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html
 import pandas as pd
 from datetime import datetime
-import time
-import random
 import logging
+import re
 import concurrent.futures
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -15,25 +18,29 @@ class ScraperConfig:
     BASE_URL: str = "https://fashion-studio.dicoding.dev"
     NUM_PAGES: int = 50
     MAX_WORKERS: int = 10
-    MIN_DELAY: float = 0.05
-    MAX_DELAY: float = 0.1
+    MAX_CONNECTIONS: int = 50
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    MAX_RETRIES: int = 3
+    TIMEOUT: float = 30.0
     HEADERS: Dict[str, str] = None
 
     def __post_init__(self):
         self.HEADERS = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 \
-                (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br'
         }
-        self.CHUNK_SIZE = self.NUM_PAGES // self.MAX_WORKERS + (self.NUM_PAGES % self.MAX_WORKERS > 0)
 
 def setup_logging() -> logging.Logger:
     """Configure and return logger instance."""
     logger = logging.getLogger(__name__)
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
     
     # Create handlers
     c_handler = logging.StreamHandler()
-    f_handler = logging.FileHandler('scraper.log')
+    f_handler = logging.FileHandler('scraper.log', delay=True)
     
     # Create formatters
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -46,141 +53,194 @@ def setup_logging() -> logging.Logger:
     
     return logger
 
+_LOGGER = setup_logging()
+
+COLUMNS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender', 'timestamp')
+DETAIL_STYLE = 'font-size: 14px; color: #777;'
+DETAIL_PATTERN = re.compile(r'(Rating|Size|Gender):|Colors')
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching elements that carry the given CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+COLLECTION_GRID_XPATH = etree.XPath("//div[@id='collectionList']")
+PRODUCT_CARDS_XPATH = etree.XPath(f".//div[{_has_class('collection-card')}]")
+PRODUCT_DETAILS_XPATH = etree.XPath(f".//div[{_has_class('product-details')}]")
+
+def _append_rows(columns: Dict[str, list], rows: List[Tuple]) -> None:
+    """Append product rows to column-oriented lists ordered like COLUMNS."""
+    for values, column in zip(zip(*rows), columns.values()):
+        column.extend(values)
+
 class ProductScraper:
     """Handles the scraping of product data from Fashion Studio website."""
     
-    def __init__(self, config: ScraperConfig, logger: logging.Logger):
+    def __init__(self, config: ScraperConfig, logger: Optional[logging.Logger] = None):
         self.config = config
-        self.logger = logger
-
-    def extract_product_details(self, soup) -> Optional[Dict[str, str]]:
-        """Extract product details from a product card."""
+        self.logger = logger or _LOGGER
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session whose connection pool is shared by all worker threads."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.MAX_WORKERS,
+            pool_maxsize=self.config.MAX_WORKERS * 2,
+            max_retries=Retry(total=self.config.MAX_RETRIES, backoff_factor=0.2)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(self.config.HEADERS)
+        return session
+
+    def extract_product_details(self, card: html.HtmlElement, timestamp: str) -> Optional[Tuple]:
+        """Extract product details from a product card as a row ordered like COLUMNS."""
         try:
-            product_details = soup.find('div', class_='product-details')
-            if not product_details:
+            matches = PRODUCT_DETAILS_XPATH(card)
+            if not matches:
                 return None
+            product_details = matches[0]
 
-            # Extract basic product information
-            product_info = self._get_basic_info(product_details)
-            
-            # Extract additional details from p tags
-            additional_info = self._get_additional_info(product_details)
+            product_info = self._get_product_info(product_details)
+            product_info['timestamp'] = timestamp
             
-            # Combine all information
-            product_info.update(additional_info)
-            product_info['timestamp'] = datetime.now().isoformat()
-            
-            return product_info
+            return tuple(product_info.values())
 
         except Exception as e:
             self.logger.error(f"Error extracting product details: {str(e)}")
             return None
 
-    def _get_basic_info(self, product_details) -> Dict:
-        """Extract basic product information."""
-        title = product_details.find('h3', class_='product-title')
-        price_container = product_details.find('div', class_='price-container')
-        price = price_container.find('span', class_='price') if price_container else None
-
-        return {
-            'Title': title.text.strip() if title else None,
-            'Price': price.text.strip() if price else None
-        }
+    def _get_product_info(self, product_details: html.HtmlElement) -> Dict:
+        """Extract product information in a single pass over the card's elements."""
+        info = dict.fromkeys(COLUMNS)
+
+        for element in product_details.iter('h3', 'span', 'p'):
+            if element.tag == 'p':
+                if element.get('style') != DETAIL_STYLE:
+                    continue
+                text = element.text_content().strip()
+                match = DETAIL_PATTERN.search(text)
+                if not match:
+                    continue
+                field = match.group(1) or 'Colors'
+                if field == 'Rating':
+                    info['Rating'] = text.replace('⭐', '').replace('Rating:', '').split('/')[0].strip()
+                else:
+                    info[field] = text
+            elif element.tag == 'h3':
+                if info['Title'] is None and 'product-title' in element.get('class', '').split():
+                    info['Title'] = element.text_content().strip()
+            elif info['Price'] is None and 'price' in element.get('class', '').split():
+                info['Price'] = element.text_content().strip()
 
-    def _get_additional_info(self, product_details) -> Dict:
-        """Extract additional product information from p tags."""
-        info = {
-            'Rating': None,
-            'Colors': None,
-            'Size': None,
-            'Gender': None
-        }
-        
-        p_tags = product_details.find_all('p', style='font-size: 14px; color: #777;')
-        for p in p_tags:
-            text = p.get_text().strip()
-            if 'Rating:' in text:
-                rating = text.replace('⭐', '').replace('Rating:', '').split('/')[0].strip()
-                info['Rating'] = rating
-            elif 'Colors' in text:
-                info['Colors'] = text
-            elif 'Size:' in text:
-                info['Size'] = text
-            elif 'Gender:' in text:
-                info['Gender'] = text
-                
         return info
 
-    def scrape_chunk(self, pages: List[int]) -> List[Dict]:
-        """Scrape a chunk of pages using a single session."""
-        products = []
-        with requests.Session() as session:
-            for page in pages:
-                products.extend(self._scrape_single_page(session, page))
-        return products
-
-    def _scrape_single_page(self, session: requests.Session, page: int) -> List[Dict]:
+    def _scrape_single_page(self, session: requests.Session, page: int) -> List[Tuple]:
         """Scrape products from a single page."""
         try:
-            url = self.config.BASE_URL if page == 1 else f"{self.config.BASE_URL}/page{page}"
+            url = self._page_url(page)
             self.logger.info(f"Scraping page {page}: {url}")
             
-            response = session.get(url, headers=self.config.HEADERS)
+            response = session.get(url, timeout=self.config.TIMEOUT)
             response.raise_for_status()
             
-            products = self._process_page_content(response.content, page)
-            time.sleep(random.uniform(self.config.MIN_DELAY, self.config.MAX_DELAY))
-            
-            return products
+            # requests reports ISO-8859-1 for any text/* response without a charset
+            declared = 'charset=' in response.headers.get('Content-Type', '').lower()
+            encoding = response.encoding if declared else None
+            return self._process_page_content(response.content, page, encoding)
 
         except Exception as e:
             self.logger.error(f"Error on page {page}: {str(e)}")
             return []
 
-    def _process_page_content(self, content: bytes, page: int) -> List[Dict]:
+    async def _fetch(self, client: httpx.AsyncClient, page: int) -> List[Tuple]:
+        """Fetch a single page asynchronously and extract its products."""
+        url = self._page_url(page)
+        self.logger.info(f"Scraping page {page}: {url}")
+
+        response = await client.get(url)
+        response.raise_for_status()
+
+        return self._process_page_content(response.content, page, response.charset_encoding)
+
+    def _page_url(self, page: int) -> str:
+        """Build the URL of a catalog page."""
+        return self.config.BASE_URL if page == 1 else f"{self.config.BASE_URL}/page{page}"
+
+    def _process_page_content(self, content: bytes, page: int, encoding: Optional[str] = None) -> List[Tuple]:
         """Process the HTML content of a page and extract products."""
-        soup = BeautifulSoup(content, 'html.parser')
-        collection_grid = soup.find('div', {'id': 'collectionList'})
+        # Decode with the response charset, defaulting to UTF-8 rather than lxml's latin-1 fallback
+        tree = html.fromstring(content, parser=html.HTMLParser(encoding=encoding or 'utf-8'))
+        collection_grid = COLLECTION_GRID_XPATH(tree)
         
         if not collection_grid:
             self.logger.error(f"Collection grid not found on page {page}")
             return []
             
-        product_cards = collection_grid.find_all('div', class_='collection-card')
+        product_cards = PRODUCT_CARDS_XPATH(collection_grid[0])
         self.logger.info(f"Found {len(product_cards)} products on page {page}")
         
+        timestamp = datetime.now().isoformat(timespec='seconds')
         return [
             product_data for card in product_cards
-            if (product_data := self.extract_product_details(card))
+            if (product_data := self.extract_product_details(card, timestamp))
         ]
 
     def scrape(self) -> pd.DataFrame:
         """Main scraping function using parallel processing."""
-        all_products = []
+        columns = {column: [] for column in COLUMNS}
         
         try:
             pages = list(range(1, self.config.NUM_PAGES + 1))
-            chunks = [pages[i:i + self.config.CHUNK_SIZE] 
-                     for i in range(0, len(pages), self.config.CHUNK_SIZE)]
             
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
                 futures = {
-                    executor.submit(self.scrape_chunk, chunk): i 
-                    for i, chunk in enumerate(chunks)
+                    executor.submit(self._scrape_single_page, self.session, page): page
+                    for page in pages
                 }
                 
                 for future in concurrent.futures.as_completed(futures):
-                    chunk_id = futures[future]
+                    page = futures[future]
                     try:
-                        products = future.result()
-                        all_products.extend(products)
-                        self.logger.info(f"Completed chunk {chunk_id + 1}/{len(chunks)}")
+                        _append_rows(columns, future.result())
                     except Exception as e:
-                        self.logger.error(f"Error processing chunk {chunk_id}: {str(e)}")
+                        self.logger.error(f"Error processing page {page}: {str(e)}")
                         continue
 
         except Exception as e:
             self.logger.error(f"Error in scraping process: {str(e)}")
             return pd.DataFrame()
 
-        return pd.DataFrame(all_products) if all_products else pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame(columns, copy=False) if columns['Title'] else pd.DataFrame()
+
+    async def scrape_async(self) -> pd.DataFrame:
+        """Scraping function fetching all pages concurrently over a single HTTP/2 client."""
+        columns = {column: [] for column in COLUMNS}
+
+        try:
+            pages = list(range(1, self.config.NUM_PAGES + 1))
+            limits = httpx.Limits(
+                max_connections=self.config.MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.MAX_KEEPALIVE_CONNECTIONS
+            )
+
+            transport = httpx.AsyncHTTPTransport(http2=True, retries=self.config.MAX_RETRIES, limits=limits)
+            timeout = httpx.Timeout(self.config.TIMEOUT, connect=10.0)
+
+            async with httpx.AsyncClient(transport=transport, headers=self.config.HEADERS, timeout=timeout) as client:
+                results = await asyncio.gather(
+                    *[self._fetch(client, page) for page in pages],
+                    return_exceptions=True
+                )
+
+            for page, result in zip(pages, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error on page {page}: {str(result)}")
+                    continue
+                _append_rows(columns, result)
+
+        except Exception as e:
+            self.logger.error(f"Error in scraping process: {str(e)}")
+            return pd.DataFrame()
+
+        return pd.DataFrame(columns, copy=False) if columns['Title'] else pd.DataFrame()
\ No newline at end of file
@@ -1,13 +1,33 @@
 from typing import Optional
 from dataclasses import dataclass
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import gspread
 from google.oauth2.service_account import Credentials
 from sqlalchemy import create_engine, types, text
+import psycopg2
+from psycopg2.extras import execute_values
 from pathlib import Path
+from io import StringIO
+import numbers
 import sys
 import time
 
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a DataFrame to a UTF-8 CSV file using PyArrow's native CSV writer."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+def _to_cell(value) -> dict:
+    """Convert a Python value to a Sheets CellData entry, leaving it unparsed like RAW input."""
+    if value is None or pd.isna(value):
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, numbers.Number):
+        return {'userEnteredValue': {'numberValue': float(value)}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
 @dataclass
 class LoadConfig:
     """Configuration settings for data loading."""
@@ -50,36 +70,20 @@ class DataLoader:
     
     # Validate data content
         try:
-            # Check Title not empty
-            if df['Title'].isna().any() or (df['Title'] == '').any():
-                print("Error: Empty titles found")
-                return False
-
-            # Check Price is positive
-            if (df['Price'] <= 0).any():
-                print("Error: Invalid prices found")
-                return False
-
-            # Check Rating is between 0 and 5
-            if ((df['Rating'] < 0) | (df['Rating'] > 5)).any():
-                print("Error: Invalid ratings found")
-                return False
-
-            # Check Colors is positive
-            if (df['Colors'] <= 0).any():
-                print("Error: Invalid color counts found")
-                return False
-
-            # Check Size is valid
             valid_sizes = ['XS', 'S', 'M', 'L', 'XL', 'XXL']
-            if not df['Size'].isin(valid_sizes).all():
-                print("Error: Invalid sizes found")
-                return False
-
-            # Check Gender is valid
             valid_genders = ['Men', 'Women', 'Unisex']
-            if not df['Gender'].isin(valid_genders).all():
-                print("Error: Invalid genders found")
+
+            # Combine all row checks into a single mask
+            invalid = (
+                df['Title'].isna() | (df['Title'] == '')
+                | (df['Price'] <= 0)
+                | (df['Rating'] < 0) | (df['Rating'] > 5)
+                | (df['Colors'] <= 0)
+                | ~df['Size'].isin(valid_sizes)
+                | ~df['Gender'].isin(valid_genders)
+            )
+            if invalid.any():
+                print(f"Error: {int(invalid.sum())} invalid records found")
                 return False
 
             # Check timestamp format
@@ -95,16 +99,20 @@ class DataLoader:
         
         return True
 
-    def load_to_csv(self, df: pd.DataFrame, filepath: Optional[str] = None) -> bool:
+    def load_to_csv(self, df: pd.DataFrame, filepath: Optional[str] = None, validated: bool = False) -> bool:
         """Save DataFrame to CSV file."""
         try:
-            if not self.validate_dataframe(df):
+            if not validated and not self.validate_dataframe(df):
                 return False
                 
             output_path = filepath or self.config.CSV_FILENAME
             print(f"\nSaving data to CSV file: {output_path}")
             
-            df.to_csv(output_path, index=False, encoding=self.config.CSV_ENCODING)
+            # PyArrow only writes UTF-8, other encodings go through pandas
+            if self.config.CSV_ENCODING.lower().replace('-', '') == 'utf8':
+                write_csv(df, output_path)
+            else:
+                df.to_csv(output_path, index=False, encoding=self.config.CSV_ENCODING)
             print(f" Successfully saved {len(df)} rows to CSV")
             return True
             
@@ -161,11 +169,29 @@ class DataLoader:
                 )
                 print(" Created new worksheet")
             
-            # Update data
+            # Resize and overwrite the worksheet in a single API call
             print("Uploading data...")
-            worksheet.clear()
             data = [df.columns.values.tolist()] + df.values.tolist()
-            worksheet.update(data, value_input_option='RAW')
+            spreadsheet.batch_update({
+                'requests': [
+                    {
+                        'updateSheetProperties': {
+                            'properties': {
+                                'sheetId': worksheet.id,
+                                'gridProperties': {'rowCount': len(data), 'columnCount': len(df.columns)}
+                            },
+                            'fields': 'gridProperties(rowCount,columnCount)'
+                        }
+                    },
+                    {
+                        'updateCells': {
+                            'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+                            'rows': [{'values': [_to_cell(value) for value in row]} for row in data],
+                            'fields': 'userEnteredValue'
+                        }
+                    }
+                ]
+            })
             
             print(f" Successfully uploaded {len(df)} rows to Google Sheets")
             return True
@@ -174,12 +200,12 @@ class DataLoader:
             print(f" Error in Google Sheets upload: {str(e)}")
             return False
 
-    def load_to_postgres(self, df: pd.DataFrame) -> bool:
+    def load_to_postgres(self, df: pd.DataFrame, validated: bool = False) -> bool:
         """Save DataFrame to PostgreSQL database."""
         print("\nUploading data to PostgreSQL...")
             
         try:
-            if not self.validate_dataframe(df):
+            if not validated and not self.validate_dataframe(df):
                 return False
                 
             # Create connection string
@@ -207,21 +233,44 @@ class DataLoader:
                 'Title': types.String(),
                 'Price': types.Float(),
                 'Rating': types.Float(),
-                'Colors': types.Integer(),
+                'Colors': types.SmallInteger(),
                 'Size': types.String(),
                 'Gender': types.String(),
                 'timestamp': types.String()
             }
             
-            # Upload data
+            # Create table schema, then stream rows through COPY
             print(f"Uploading data to table: {self.config.TABLE_NAME}")
-            df.to_sql(
+            df.head(0).to_sql(
                 self.config.TABLE_NAME,
                 engine,
                 if_exists='replace',
                 index=False,
                 dtype=dtype
             )
+
+            buffer = StringIO()
+            df.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+
+            conn = engine.raw_connection()
+            try:
+                with conn.cursor() as cur:
+                    cur.copy_expert(
+                        f"COPY {self.config.TABLE_NAME} FROM STDIN WITH (FORMAT CSV)",
+                        buffer
+                    )
+                conn.commit()
+                copied = True
+            except psycopg2.Error as e:
+                conn.rollback()
+                print(f" COPY failed, falling back to execute_values INSERT: {str(e).strip()}")
+                copied = False
+            finally:
+                conn.close()
+
+            if not copied:
+                self._insert_rows(engine, df)
             
             # Verify upload
             with engine.connect() as conn:
@@ -237,3 +286,21 @@ class DataLoader:
         except Exception as e:
             print(f" Error in PostgreSQL upload: {str(e)}")
             return False
+
+    def _insert_rows(self, engine, df: pd.DataFrame) -> None:
+        """Insert rows into the PostgreSQL table with paged multi-VALUES statements."""
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        rows = list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+        conn = engine.raw_connection()
+        try:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    f"INSERT INTO {self.config.TABLE_NAME} ({columns}) VALUES %s",
+                    rows,
+                    page_size=1000
+                )
+            conn.commit()
+        finally:
+            conn.close()
@@ -1,18 +1,23 @@
 import pandas as pd
-from typing import Optional
+import re
 from dataclasses import dataclass
 from datetime import datetime
 
+PRICE_PATTERN = re.compile(r'[$,\s]')
+COLORS_PATTERN = re.compile(r'^\s*(\d+)(?:\s|$)')
+VALID_SIZES = frozenset({'XS', 'S', 'M', 'L', 'XL', 'XXL'})
+VALID_GENDERS = frozenset({'Men', 'Women', 'Unisex'})
+
 @dataclass
 class TransformConfig:
     """Configuration settings for data transformation."""
     EXCHANGE_RATE: float = 16000.0
-    VALID_SIZES: set = None
-    VALID_GENDERS: set = None
+    VALID_SIZES: frozenset = None
+    VALID_GENDERS: frozenset = None
 
     def __post_init__(self):
-        self.VALID_SIZES = {'XS', 'S', 'M', 'L', 'XL', 'XXL'}
-        self.VALID_GENDERS = {'Men', 'Women', 'Unisex'}
+        self.VALID_SIZES = VALID_SIZES
+        self.VALID_GENDERS = VALID_GENDERS
 
 class DataTransformer:
     """Handles the transformation of scraped fashion product data."""
@@ -20,66 +25,6 @@ class DataTransformer:
     def __init__(self, config: TransformConfig):
         self.config = config
 
-    def transform_price(self, price: str) -> Optional[float]:
-        """Convert USD price string to IDR float value."""
-        try:
-            if pd.isna(price):
-                return None
-            cleaned_price = float(price.replace('$', '').replace(',', '').strip())
-            return cleaned_price * self.config.EXCHANGE_RATE
-        except (ValueError, AttributeError):
-            return None
-
-    def transform_rating(self, rating: str) -> Optional[float]:
-        """Convert rating string to float value."""
-        try:
-            if pd.isna(rating) or 'Invalid' in str(rating) or 'Not Rated' in str(rating):
-                return None
-            cleaned_rating = rating.split('/')[0].strip()
-            return float(cleaned_rating)
-        except (ValueError, AttributeError):
-            return None
-
-    def transform_colors(self, colors: str) -> Optional[int]:
-        """Extract number of colors as integer only."""
-        try:
-            if pd.isna(colors):
-                return None
-            num_colors = colors.split()[0]  # Get first part (number)
-            return int(num_colors) if num_colors.isdigit() else None
-        except (ValueError, AttributeError, IndexError):
-            return None
-
-    def transform_size(self, size: str) -> Optional[str]:
-        """Extract size value only, without 'Size:' prefix."""
-        try:
-            if pd.isna(size):
-                return None
-            cleaned_size = size.replace('Size:', '').strip()
-            return cleaned_size if cleaned_size in self.config.VALID_SIZES else None
-        except AttributeError:
-            return None
-
-    def transform_gender(self, gender: str) -> Optional[str]:
-        """Extract gender value only, without 'Gender:' prefix."""
-        try:
-            if pd.isna(gender):
-                return None
-            cleaned_gender = gender.replace('Gender:', '').strip()
-            return cleaned_gender if cleaned_gender in self.config.VALID_GENDERS else None
-        except AttributeError:
-            return None
-
-    def transform_timestamp(self, timestamp: str) -> Optional[str]:
-        """Convert timestamp to simple UTC+8 format."""
-        try:
-            if pd.isna(timestamp):
-                return None
-            dt = pd.to_datetime(timestamp)
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
-        except (ValueError, AttributeError):
-            return None
-
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Transform the entire dataframe according to requirements."""
         print("\nStarting data transformation...")
@@ -91,15 +36,27 @@ class DataTransformer:
             print("Empty DataFrame or missing required columns")
             return pd.DataFrame(columns=required_columns)
 
-        df_cleaned = df.copy()
+        # Shallow copy: every transformed column is reassigned, so the input is never mutated
+        df_cleaned = df.copy(deep=False)
+
+        # Apply vectorized transformations
+        price = df_cleaned['Price'].astype(str).str.replace(PRICE_PATTERN, '', regex=True)
+        df_cleaned['Price'] = pd.to_numeric(price, errors='coerce') * self.config.EXCHANGE_RATE
+
+        rating = df_cleaned['Rating'].astype(str).str.split('/').str[0].str.strip()
+        df_cleaned['Rating'] = pd.to_numeric(rating, errors='coerce')
+
+        colors = df_cleaned['Colors'].astype(str).str.extract(COLORS_PATTERN, expand=False)
+        df_cleaned['Colors'] = pd.to_numeric(colors, errors='coerce').astype('Int32')
+
+        size = df_cleaned['Size'].astype(str).str.replace('Size:', '', regex=False).str.strip()
+        df_cleaned['Size'] = size.where(size.isin(self.config.VALID_SIZES))
+
+        gender = df_cleaned['Gender'].astype(str).str.replace('Gender:', '', regex=False).str.strip()
+        df_cleaned['Gender'] = gender.where(gender.isin(self.config.VALID_GENDERS))
 
-        # Apply transformations
-        df_cleaned['Price'] = df_cleaned['Price'].apply(self.transform_price)
-        df_cleaned['Rating'] = df_cleaned['Rating'].apply(self.transform_rating)
-        df_cleaned['Colors'] = df_cleaned['Colors'].apply(self.transform_colors)
-        df_cleaned['Size'] = df_cleaned['Size'].apply(self.transform_size)
-        df_cleaned['Gender'] = df_cleaned['Gender'].apply(self.transform_gender)
-        df_cleaned['timestamp'] = df_cleaned['timestamp'].apply(self.transform_timestamp)
+        timestamp = pd.to_datetime(df_cleaned['timestamp'], errors='coerce', format='ISO8601')
+        df_cleaned['timestamp'] = timestamp.dt.strftime('%Y-%m-%d %H:%M:%S')
 
         # Remove invalid data
         print("Removing invalid records...")
@@ -118,13 +75,13 @@ class DataTransformer:
         # Set correct data types
         print("Setting correct data types...")
         df_cleaned = df_cleaned.astype({
-            'Title': 'object',  
-            'Price': 'float64',
+            'Title': 'string[pyarrow]',
+            'Price': 'float32',
             'Rating': 'float64',
-            'Colors': 'int32',
-            'Size': 'object',   
-            'Gender': 'object', 
-            'timestamp': 'string'
+            'Colors': 'int16',
+            'Size': 'category',
+            'Gender': 'category',
+            'timestamp': 'string[pyarrow]'
         })
 
         # Print transformation statistics